@@ -1,39 +1,155 @@
 # compare_tools.py
 
+import argparse  # For parsing command-line arguments
+import asyncio  # For running the tool calls concurrently
 import os  # For accessing environment variables
+import sys  # For reading piped prompts and writing the report
 import logging  # For logging information and errors
-from typing import List
+from dataclasses import dataclass  # For the column-wise metrics table
+from typing import Final, Iterable, List, Tuple
 
-from services.metrics_service import MetricsService  # Service to retrieve tool metrics
+import numpy as np  # For the column-wise metrics arrays passed to the ranking kernel
+
+from services.agent_service import AgentService  # Service orchestrating tool selection and execution
+from services.metrics_service import MetricsService, ToolMetrics  # Service to retrieve tool metrics
 from services.tool_selector import ToolSelector  # Service to select tools based on metrics
+from services.metrics_kernels import DEFAULT_WEIGHTS, rank  # Compiled metrics ranking kernel
 from plugins.openai_client import OpenAIClient  # Client to interact with OpenAI GPT
 from plugins.llama_client import LlamaClient  # Client to interact with Llama AI
+from plugins.openai_batch import OpenAIBatchClient  # Client for the OpenAI Batch API
 from models.tools import AgentTool  # Enum of available tools
 from config.security import load_env_variables  # Function to load environment variables securely
+from config.logging_config import setup_logging  # Shared logging configuration
+from utils.batching import batch_custom_id, execute_concurrently  # Concurrent execution with retries
+
+logger = logging.getLogger(__name__)
+
+# Tools compared by this application
+AVAILABLE_TOOLS: Final[Tuple[AgentTool, ...]] = (
+    AgentTool.openai_gpt,
+    AgentTool.llama,
+)
+
+# Metrics comparison table layout, built once: the header line and a bound formatter for each row
+METRICS_HEADER = f"{'Tool':<15}{'Cost ($)':<10}{'Latency (s)':<12}{'Quality':<10}{'CO2 Impact (kg)':<15}"
+METRICS_ROW = "{:<15}{:<10.4f}{:<12}{:<10.2f}{:<15.6f}".format
+
+# Latency cell and footnote for tools whose latency was not measured (Batch API jobs)
+UNMEASURED_LATENCY = "n/a*"
+UNMEASURED_LATENCY_NOTE = "* Latency not measured: Batch API jobs complete asynchronously, and cached responses make no call."
+
+def format_latency(latency: float) -> str:
+    """
+    Format a latency for the metrics table.
+
+    Args:
+        latency (float): Average latency in seconds, or NaN if it was not measured.
+
+    Returns:
+        str: The table cell.
+    """
+    return UNMEASURED_LATENCY if np.isnan(latency) else f"{latency:.4f}"
+
+@dataclass
+class MetricsTable:
+    """
+    Metrics of the compared tools stored column-wise, one array per metric.
+
+    Row i of every array belongs to the same tool, so the columns can be passed
+    straight to the ranking kernel without gathering attributes per tool.
+
+    Attributes:
+        tools (np.ndarray): Tool names.
+        cost (np.ndarray): Cost per request in USD.
+        latency (np.ndarray): Average latency per call in seconds; NaN if not measured.
+        quality (np.ndarray): Quality score.
+        co2_impact (np.ndarray): CO2 impact in kg per request.
+    """
+    tools: np.ndarray
+    cost: np.ndarray
+    latency: np.ndarray
+    quality: np.ndarray
+    co2_impact: np.ndarray
+
+    @classmethod
+    def allocate(cls, size: int) -> "MetricsTable":
+        """
+        Create a table with room for the given number of tools.
+
+        Args:
+            size (int): Number of rows to allocate.
+
+        Returns:
+            MetricsTable: A table whose rows are filled in with set_row().
+        """
+        return cls(
+            tools=np.empty(size, dtype=object),
+            cost=np.zeros(size, dtype=np.float32),
+            latency=np.zeros(size, dtype=np.float32),
+            quality=np.zeros(size, dtype=np.float32),
+            co2_impact=np.zeros(size, dtype=np.float32),
+        )
+
+    def set_row(self, index: int, tool_name: str, tool_metrics: ToolMetrics):
+        """
+        Store a tool's metrics in the given row.
+
+        Args:
+            index (int): The row to fill.
+            tool_name (str): The name of the tool.
+            tool_metrics (ToolMetrics): The metrics of the tool.
+        """
+        self.tools[index] = tool_name
+        self.cost[index] = tool_metrics.cost
+        self.latency[index] = tool_metrics.latency
+        self.quality[index] = tool_metrics.quality
+        self.co2_impact[index] = tool_metrics.co2_impact
+
+    def select(self, rows: List[int]) -> "MetricsTable":
+        """
+        Return a table containing only the given rows.
+
+        Args:
+            rows (List[int]): The rows to keep, in order.
+
+        Returns:
+            MetricsTable: The selected rows.
+        """
+        return MetricsTable(
+            tools=self.tools[rows],
+            cost=self.cost[rows],
+            latency=self.latency[rows],
+            quality=self.quality[rows],
+            co2_impact=self.co2_impact[rows],
+        )
 
-def setup_logging():
+def parse_args() -> argparse.Namespace:
     """
-    Configure the logging settings for the application.
-    Logs are displayed with timestamp, logger name, log level, and message.
+    Parse the command-line arguments.
+
+    Returns:
+        argparse.Namespace: The parsed arguments.
     """
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    parser = argparse.ArgumentParser(description="Compare AI tools on cost, latency, quality, and CO2 impact.")
+    parser.add_argument(
+        "--batch-file",
+        help="File with one prompt per line; prompts are submitted together instead of asking for a query.",
     )
+    return parser.parse_args()
 
-def get_available_tools() -> List[AgentTool]:
+def read_prompts(lines: Iterable[str]) -> List[str]:
     """
-    Define and return the list of available tools for comparison.
-    
+    Read one prompt per line, skipping blank lines.
+
+    Args:
+        lines (Iterable[str]): The lines to read, e.g. an open batch file or sys.stdin.
+
     Returns:
-        List[AgentTool]: A list containing AgentTool enums for OpenAI GPT and Llama.
+        List[str]: The prompts in input order.
     """
-    return [
-        AgentTool.openai_gpt,
-        AgentTool.llama,
-    ]
+    return [line.strip() for line in lines if line.strip()]
 
-def main():
+async def main():
     """
     Main function to run the sample application.
     
@@ -41,20 +157,21 @@ def main():
     1. Sets up logging.
     2. Loads environment variables securely.
     3. Initializes services and clients.
-    4. Prompts the user for a query.
-    5. Processes the query using both OpenAI GPT and Llama.
-    6. Retrieves and compares metrics.
+    4. Prompts the user for a query, or reads many prompts from --batch-file or piped stdin.
+    5. Processes the prompts using both OpenAI GPT and Llama concurrently.
+       In batch mode OpenAI prompts go through the Batch API as a single job.
+    6. Retrieves metrics and ranks the tools.
     7. Displays the comparison to the user.
     """
-    # Step 1: Set up logging
+    # Step 1: Set up logging and parse command-line arguments
     setup_logging()
-    logger = logging.getLogger(__name__)
+    args = parse_args()
     
     # Step 2: Load environment variables securely
     try:
-        load_env_variables()
+        env = load_env_variables()
     except EnvironmentError as e:
-        logger.error(f"Environment configuration error: {e}")
+        logger.error("Environment configuration error: %s", e)
         return
     
     # Step 3: Initialize MetricsService
@@ -63,80 +180,154 @@ def main():
     # Step 4: Initialize ToolSelector with MetricsService
     tool_selector = ToolSelector(metrics_service)
     
-    # Step 5: Initialize API Clients with API keys from environment variables
-    openai_api_key = os.getenv('OPENAI_API_KEY')
-    llama_api_key = os.getenv('LLAMA_API_KEY')
-    
-    if not openai_api_key or not llama_api_key:
-        logger.error("API keys for OpenAI or Llama are not set in environment variables.")
-        return
+    # Step 5: Initialize API Clients with API keys from the loaded environment
+    openai_api_key = env['OPENAI_API_KEY']
+    llama_api_key = env['LLAMA_API_KEY']
     
     openai_client = OpenAIClient(api_key=openai_api_key)
     llama_client = LlamaClient(api_key=llama_api_key)
+
+    # The semantic cache is opt-in: set SEMANTIC_CACHE_PATH to reuse responses to similar
+    # prompts, persisted across runs. One cache is shared between the clients, with
+    # responses namespaced per tool so a cached OpenAI answer is never reported as Llama's.
+    cache_path = os.getenv('SEMANTIC_CACHE_PATH')
+    semantic_cache = None
+    if cache_path:
+        # Imported here so that runs without the cache never need faiss or sentence-transformers
+        from services.semantic_cache import SemanticCache
+        semantic_cache = SemanticCache(path=cache_path)
     
     # Step 6: Initialize AgentService with ToolSelector and API clients
-    from services.agent_service import AgentService  # Import here to avoid circular imports
     agent_service = AgentService(
         tool_selector=tool_selector,
         openai_client=openai_client,
         llama_client=llama_client
     )
     
-    # Step 7: Define available tools
-    available_tools = get_available_tools()
-    
-    # Step 8: Prompt the user for a query
-    user_query = input("Enter your query to describe: ").strip()
-    if not user_query:
+    # Step 7: Read the prompts from the batch file or piped stdin, or prompt the user for a query
+    if args.batch_file:
+        with open(args.batch_file, encoding="utf-8") as f:
+            prompts = read_prompts(f)
+    elif sys.stdin.isatty():
+        user_query = input("Enter your query to describe: ").strip()
+        prompts = [user_query] if user_query else []
+    else:
+        prompts = read_prompts(sys.stdin)
+    if not prompts:
         logger.error("No query entered. Exiting application.")
         return
     
-    # Step 9: Execute the query using both tools and collect metrics
+    # Step 8: Execute the prompts using both tools concurrently and collect metrics
+    # Map each supported tool to its execute callable
+    dispatch = {
+        AgentTool.openai_gpt: openai_client.execute,
+        AgentTool.llama: llama_client.execute,
+    }
+    # In batch mode, tools with a native batch API submit all prompts in one job instead
+    batch_dispatch = {}
+    if args.batch_file:
+        openai_batch_client = OpenAIBatchClient(api_key=openai_api_key)
+        batch_dispatch[AgentTool.openai_gpt] = openai_batch_client.execute_batch
+
+    async def _run_tool(tool: AgentTool):
+        """
+        Execute every prompt with a single tool and measure its latency.
+
+        The blocking client calls run in worker threads so that all tools are
+        queried at the same time. Latency is the average duration of the tool's
+        successful calls, excluding responses served from the semantic cache; it
+        is NaN for Batch API jobs, whose turnaround is dominated by queueing and
+        polling rather than by the calls themselves.
+        """
+        execute = dispatch.get(tool)
+        if execute is None:
+            logger.warning("Tool %s is not supported in this comparison.", tool)
+            return None
+        execute_batch = batch_dispatch.get(tool)
+        cached_count = 0
+        if execute_batch is not None:
+            responses = await asyncio.to_thread(execute_batch, prompts)
+            latency = float("nan")
+        else:
+            batch_results = await execute_concurrently(
+                execute, prompts, cache=semantic_cache, namespace=tool,
+            )
+            responses = batch_results.responses
+            cached_count = len(batch_results.cached)
+            latencies = list(batch_results.latencies.values())
+            latency = float(np.mean(latencies)) if latencies else float("nan")
+        if not responses:
+            raise RuntimeError("no prompt completed successfully")
+
+        # Retrieve metrics from MetricsService and update the measured latency
+        tool_metrics = await asyncio.to_thread(metrics_service.get_metrics, tool)
+        tool_metrics.latency = latency
+        return responses, tool_metrics, cached_count
+
+    outcomes = await asyncio.gather(
+        *[_run_tool(tool) for tool in AVAILABLE_TOOLS],
+        return_exceptions=True,
+    )
+
     results = {}
-    metrics = {}
-    
-    for tool in available_tools:
-        try:
-            # Record the start time for latency measurement
-            start_time = time.time()
-            
-            # Execute the query using the respective tool
-            if tool == AgentTool.openai_gpt:
-                response = openai_client.execute(prompt=user_query)
-            elif tool == AgentTool.llama:
-                response = llama_client.execute(prompt=user_query)
-            else:
-                logger.warning(f"Tool {tool.value} is not supported in this comparison.")
-                continue
-            
-            # Calculate latency
-            latency = time.time() - start_time
-            
-            # Retrieve metrics from MetricsService
-            tool_metrics = metrics_service.get_metrics(tool)
-            
-            # Update latency in metrics
-            tool_metrics.latency = latency
-            
-            # Store the response and metrics
-            results[tool.value] = response.content
-            metrics[tool.value] = tool_metrics
-            
-        except Exception as e:
-            logger.error(f"Error executing tool {tool.value}: {e}")
+    cache_notes = []
+    metrics = MetricsTable.allocate(len(AVAILABLE_TOOLS))
+    filled_rows = []
+
+    for index, (tool, outcome) in enumerate(zip(AVAILABLE_TOOLS, outcomes)):
+        if isinstance(outcome, Exception):
+            logger.error("Error executing tool %s: %s", tool, outcome)
+            continue
+        if outcome is None:
             continue
+
+        # Store the response and metrics
+        responses, tool_metrics, cached_count = outcome
+        results[tool] = {custom_id: response.content for custom_id, response in responses.items()}
+        if cached_count:
+            cache_notes.append(
+                f"{tool}: {cached_count} of {len(prompts)} prompts served from the semantic cache (excluded from latency)"
+            )
+        metrics.set_row(index, tool, tool_metrics)
+        filled_rows.append(index)
+
+    # Keep only the tools that completed successfully
+    metrics = metrics.select(filled_rows)
+
+    if semantic_cache is not None:
+        semantic_cache.save()
     
-    # Step 10: Display the results and metrics comparison
+    # Step 9: Display the results and metrics comparison
     if not results:
         logger.error("No successful tool executions to compare.")
         return
     
-    print("\n=== Query Results ===")
-    for tool_name, content in results.items():
-        print(f"\n-- {tool_name.upper()} --")
-        print(content)
+    # Collect the whole report and write it to stdout in a single call
+    lines = ["", "=== Query Results ==="]
+    for index, prompt in enumerate(prompts):
+        custom_id = batch_custom_id(index)
+        if len(prompts) > 1:
+            lines.extend(["", f"### [{custom_id}] {prompt}"])
+        for tool_name, contents in results.items():
+            if custom_id in contents:
+                lines.extend(["", f"-- {tool_name.upper()} --", str(contents[custom_id])])
     
-    print("\n=== Metrics Comparison ===")
-    print(f"{'Tool':<15}{'Cost ($)':<10}{'Latency (s)':<12}{'Quality':<10}{'CO2 Impact (kg)':<15}")
-    print("-" * 62)
-    for tool_name, metric in metrics.items()
+    # Rank the tools from best to worst with the compiled scoring kernel
+    order = rank(metrics.cost, metrics.latency, metrics.quality, metrics.co2_impact, DEFAULT_WEIGHTS)
+    
+    lines.extend(["", "=== Metrics Comparison (best first) ===", METRICS_HEADER, "-" * 62])
+    lines.extend(
+        METRICS_ROW(
+            metrics.tools[index], metrics.cost[index], format_latency(metrics.latency[index]),
+            metrics.quality[index], metrics.co2_impact[index],
+        )
+        for index in order
+    )
+    if np.isnan(metrics.latency).any():
+        lines.extend(["", UNMEASURED_LATENCY_NOTE])
+    if cache_notes:
+        lines.extend(["", *cache_notes])
+    sys.stdout.write("\n".join(lines) + "\n")
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,18 @@
+# config/logging_config.py
+
+import logging
+
+# Log line layout: timestamp, logger name, log level, and message
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+def setup_logging():
+    """
+    Configure the logging settings for the application.
+    Logs are displayed with timestamp, logger name, log level, and message.
+    """
+    # Skip looking up thread and process details for every record; the format does not use them
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
+    logging.basicConfig(level=logging.INFO, format=LOG_FORMAT)
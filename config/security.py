@@ -1,16 +1,29 @@
 # config/security.py
 
+import functools
 import os
+from types import MappingProxyType
+from typing import Mapping
+
 from dotenv import load_dotenv
 
-def load_env_variables():
+# Environment variables that must be set for the application to run
+REQUIRED_ENV_VARS = ('OPENAI_API_KEY', 'LLAMA_API_KEY')
+
+@functools.lru_cache(maxsize=1)
+def load_env_variables() -> Mapping[str, str]:
     """
     Load environment variables from a .env file if present.
     Ensures that API keys and other sensitive information are securely loaded.
+
+    The .env file is only read on the first call; later calls return the same snapshot.
+
+    Returns:
+        Mapping[str, str]: A read-only snapshot of the required environment variables.
     """
-    load_dotenv()  # Load variables from .env into environment
-    # Validate essential environment variables
-    required_vars = ['OPENAI_API_KEY', 'LLAMA_API_KEY']
-    missing_vars = [var for var in required_vars if not os.getenv(var)]
+    load_dotenv(override=False)  # Load variables from .env into environment
+    # Validate essential environment variables; blank values count as missing
+    missing_vars = {var for var in REQUIRED_ENV_VARS if not os.environ.get(var, "").strip()}
     if missing_vars:
-        raise EnvironmentError(f"Missing required environment variables: {', '.join(missing_vars)}")
+        raise EnvironmentError(f"Missing required environment variables: {', '.join(sorted(missing_vars))}")
+    return MappingProxyType({var: os.environ[var] for var in REQUIRED_ENV_VARS})
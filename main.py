@@ -1,8 +1,6 @@
 # main.py
 
-import logging
-import os
-from typing import List
+from typing import Final, Tuple
 
 from models.attachments import Attachment
 from models.tools import AgentTool
@@ -12,18 +10,24 @@ from services.tool_selector import ToolSelector
 from plugins.openai_client import OpenAIClient
 from plugins.llama_client import LlamaClient
 from config.security import load_env_variables
+from config.logging_config import setup_logging
 
-def setup_logging():
-    """Configure the logging settings."""
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    )
+# Tools the agent can choose from
+AVAILABLE_TOOLS: Final[Tuple[AgentTool, ...]] = (
+    AgentTool.openai_gpt,
+    AgentTool.llama,
+    AgentTool.brave_search,
+    AgentTool.wolfram_alpha,
+    AgentTool.photogen,
+    AgentTool.code_interpreter,
+    AgentTool.function_call,
+    AgentTool.memory,
+)
 
 def main():
     """Main function to run the Agentic System."""
     setup_logging()
-    load_env_variables()  # Load environment variables securely
+    env = load_env_variables()  # Load environment variables securely
 
     # Initialize MetricsService
     metrics_service = MetricsService()
@@ -31,9 +35,9 @@ def main():
     # Initialize ToolSelector with MetricsService
     tool_selector = ToolSelector(metrics_service)
 
-    # Initialize API Clients with API keys from environment variables
-    openai_client = OpenAIClient(api_key=os.getenv('OPENAI_API_KEY'))
-    llama_client = LlamaClient(api_key=os.getenv('LLAMA_API_KEY'))
+    # Initialize API Clients with API keys from the loaded environment
+    openai_client = OpenAIClient(api_key=env['OPENAI_API_KEY'])
+    llama_client = LlamaClient(api_key=env['LLAMA_API_KEY'])
 
     # Initialize AgentService with ToolSelector and API clients
     agent_service = AgentService(
@@ -42,31 +46,19 @@ def main():
         llama_client=llama_client
     )
 
-    # Define available tools
-    available_tools: List[AgentTool] = [
-        AgentTool.openai_gpt,
-        AgentTool.llama,
-        AgentTool.brave_search,
-        AgentTool.wolfram_alpha,
-        AgentTool.photogen,
-        AgentTool.code_interpreter,
-        AgentTool.function_call,
-        AgentTool.memory,
-    ]
-
     # Example prompt
     prompt = "Explain the theory of relativity."
 
     # Manual Mode
     print("=== Manual Mode ===")
     agent_service.set_selection_mode("manual")
-    response_manual = agent_service.handle_request(prompt, available_tools)
+    response_manual = agent_service.handle_request(prompt, AVAILABLE_TOOLS)
     print("Manual Mode Response:", response_manual.content)
 
     # Automated Mode
     print("\n=== Automated Mode ===")
     agent_service.set_selection_mode("automated")
-    response_automated = agent_service.handle_request(prompt, available_tools)
+    response_automated = agent_service.handle_request(prompt, AVAILABLE_TOOLS)
     print("Automated Mode Response:", response_automated.content)
 
 if __name__ == "__main__":
@@ -1,16 +1,16 @@
 
 # models/memory_banks.py
 
-from enum import Enum
-from typing import List, Literal, Optional
+from enum import StrEnum
+from typing import List, Literal, Optional, Union
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 from typing_extensions import Annotated
 
 from llama_models.schema_utils import json_schema_type
 from llama_stack.apis.memory import MemoryBank  # Assuming this is defined
 
-class MemoryBankType(Enum):
+class MemoryBankType(StrEnum):
     """
     Enum for different types of memory banks.
 
@@ -91,3 +91,8 @@ MemoryBankConfig = Annotated[
     ],
     Field(discriminator="type"),  # Use the 'type' field to discriminate between different configurations
 ]
+
+# Validator for MemoryBankConfig, built once at import time so the discriminated union
+# is compiled a single time; use MEMORY_BANK_ADAPTER.validate_python(data) or
+# MEMORY_BANK_ADAPTER.validate_json(raw) instead of building a TypeAdapter per call
+MEMORY_BANK_ADAPTER = TypeAdapter(MemoryBankConfig)
@@ -1,92 +1,211 @@
-# models/memory_banks.py
+# models/tools.py
 
-from enum import Enum
-from typing import List, Literal, Optional
+from enum import StrEnum
+from typing import Dict, List, Literal, Optional, Union
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 from typing_extensions import Annotated
 
 from llama_models.schema_utils import json_schema_type
-from llama_stack.apis.memory import MemoryBank  # Assuming this is defined
+from llama_stack.apis.common.deployment_types import RestAPIExecutionConfig
+from llama_models.llama3.api.datatypes import ToolParamDefinition
 
-class MemoryBankType(Enum):
+class AgentTool(StrEnum):
     """
-    Enum for different types of memory banks.
+    Enum for the different tools that an agent can utilize.
 
     Attributes:
-        vector: Represents a vector-based memory bank.
-        keyvalue: Represents a key-value-based memory bank.
-        keyword: Represents a keyword-based memory bank.
-        graph: Represents a graph-based memory bank.
+        brave_search: Represents the Brave search tool.
+        wolfram_alpha: Represents the Wolfram Alpha tool.
+        photogen: Represents the Photogen tool.
+        code_interpreter: Represents a code interpreter tool.
+        function_call: Represents a function calling tool.
+        memory: Represents a memory tool.
+        openai_gpt: Represents the OpenAI GPT tool.
+        llama: Represents the Llama tool.
     """
-    vector = "vector"
-    keyvalue = "keyvalue"
-    keyword = "keyword"
-    graph = "graph"
+    brave_search = "brave_search"
+    wolfram_alpha = "wolfram_alpha"
+    photogen = "photogen"
+    code_interpreter = "code_interpreter"
+    function_call = "function_call"
+    memory = "memory"
+    openai_gpt = "openai_gpt"
+    llama = "llama"
+
+class ToolDefinitionCommon(BaseModel):
+    """
+    Common attributes for all tool definitions.
+
+    Tool definitions are immutable once created.
+
+    Attributes:
+        input_shields (Optional[List[str]]): A list of input shields used for filtering input data.
+        output_shields (Optional[List[str]]): A list of output shields used for filtering output data.
+    """
+    model_config = ConfigDict(frozen=True)
+
+    # Optional list of input shields with a default empty list
+    input_shields: Optional[List[str]] = Field(default_factory=list)
+    # Optional list of output shields with a default empty list
+    output_shields: Optional[List[str]] = Field(default_factory=list)
 
-class _MemoryBankConfigCommon(BaseModel):
+class SearchEngineType(StrEnum):
     """
-    Common attributes for all memory bank configurations.
+    Enum for the different search engines available for use in the search tool.
 
     Attributes:
-        bank_id (str): The identifier for the memory bank.
+        bing: Represents the Bing search engine.
+        brave: Represents the Brave search engine.
     """
-    # The unique identifier for the memory bank
-    bank_id: str
+    bing = "bing"
+    brave = "brave"
 
-class AgentVectorMemoryBankConfig(_MemoryBankConfigCommon):
+@json_schema_type
+class SearchToolDefinition(ToolDefinitionCommon):
     """
-    Configuration for a vector-based memory bank.
+    Definition of the Search tool used by the agent.
 
     Attributes:
-        type (Literal[MemoryBankType.vector.value]): The type of memory bank (vector).
+        type (Literal[AgentTool.brave_search.value]): Type of tool (always brave_search).
+        api_key (str): The API key for the search engine.
+        engine (SearchEngineType): The search engine to use (default is Brave).
+        remote_execution (Optional[RestAPIExecutionConfig]): Configuration for executing the tool remotely.
     """
-    # The type of memory bank, fixed to 'vector'
-    type: Literal[MemoryBankType.vector.value] = MemoryBankType.vector.value
+    # The type of tool, fixed to 'brave_search'
+    type: Literal[AgentTool.brave_search.value] = AgentTool.brave_search.value
+    # API key for the search engine
+    api_key: str
+    # The search engine to use, Brave by default
+    engine: SearchEngineType = SearchEngineType.brave
+    # Optional configuration for executing the tool remotely
+    remote_execution: Optional[RestAPIExecutionConfig] = None
+
+@json_schema_type
+class WolframAlphaToolDefinition(ToolDefinitionCommon):
+    """
+    Definition of the Wolfram Alpha tool used by the agent.
 
-class AgentKeyValueMemoryBankConfig(_MemoryBankConfigCommon):
+    Attributes:
+        type (Literal[AgentTool.wolfram_alpha.value]): Type of tool (always wolfram_alpha).
+        api_key (str): The API key for Wolfram Alpha.
+        remote_execution (Optional[RestAPIExecutionConfig]): Configuration for executing the tool remotely.
     """
-    Configuration for a key-value-based memory bank.
+    # The type of tool, fixed to 'wolfram_alpha'
+    type: Literal[AgentTool.wolfram_alpha.value] = AgentTool.wolfram_alpha.value
+    # API key for Wolfram Alpha
+    api_key: str
+    # Optional configuration for executing the tool remotely
+    remote_execution: Optional[RestAPIExecutionConfig] = None
+
+@json_schema_type
+class PhotogenToolDefinition(ToolDefinitionCommon):
+    """
+    Definition of the Photogen tool used by the agent.
 
     Attributes:
-        type (Literal[MemoryBankType.keyvalue.value]): The type of memory bank (key-value).
-        keys (List[str]): List of keys to focus on for storing memory.
+        type (Literal[AgentTool.photogen.value]): Type of tool (always photogen).
+        remote_execution (Optional[RestAPIExecutionConfig]): Configuration for executing the tool remotely.
     """
-    # The type of memory bank, fixed to 'keyvalue'
-    type: Literal[MemoryBankType.keyvalue.value] = MemoryBankType.keyvalue.value
-    # List of keys that the memory bank will focus on for storing memory
-    keys: List[str]
+    # The type of tool, fixed to 'photogen'
+    type: Literal[AgentTool.photogen.value] = AgentTool.photogen.value
+    # Optional configuration for executing the tool remotely
+    remote_execution: Optional[RestAPIExecutionConfig] = None
 
-class AgentKeywordMemoryBankConfig(_MemoryBankConfigCommon):
+@json_schema_type
+class CodeInterpreterToolDefinition(ToolDefinitionCommon):
     """
-    Configuration for a keyword-based memory bank.
+    Definition of the Code Interpreter tool used by the agent.
 
     Attributes:
-        type (Literal[MemoryBankType.keyword.value]): The type of memory bank (keyword).
+        type (Literal[AgentTool.code_interpreter.value]): Type of tool (always code_interpreter).
+        enable_inline_code_execution (bool): Whether to enable inline code execution (default is True).
+        remote_execution (Optional[RestAPIExecutionConfig]): Configuration for executing the tool remotely.
+    """
+    # The type of tool, fixed to 'code_interpreter'
+    type: Literal[AgentTool.code_interpreter.value] = AgentTool.code_interpreter.value
+    # Whether inline code execution is enabled
+    enable_inline_code_execution: bool = True
+    # Optional configuration for executing the tool remotely
+    remote_execution: Optional[RestAPIExecutionConfig] = None
+
+@json_schema_type
+class FunctionCallToolDefinition(ToolDefinitionCommon):
     """
-    # The type of memory bank, fixed to 'keyword'
-    type: Literal[MemoryBankType.keyword.value] = MemoryBankType.keyword.value
+    Definition of the Function Call tool used by the agent.
 
-class AgentGraphMemoryBankConfig(_MemoryBankConfigCommon):
+    Attributes:
+        type (Literal[AgentTool.function_call.value]): Type of tool (always function_call).
+        function_name (str): The name of the function to be called.
+        description (str): A description of the function.
+        parameters (Dict[str, ToolParamDefinition]): The parameters required for the function.
+        remote_execution (Optional[RestAPIExecutionConfig]): Configuration for executing the tool remotely.
+    """
+    # The type of tool, fixed to 'function_call'
+    type: Literal[AgentTool.function_call.value] = AgentTool.function_call.value
+    # Name of the function to call
+    function_name: str
+    # Description of the function
+    description: str
+    # Parameters for the function, keyed by name
+    parameters: Dict[str, ToolParamDefinition]
+    # Optional configuration for executing the tool remotely
+    remote_execution: Optional[RestAPIExecutionConfig] = None
+
+@json_schema_type
+class OpenAIToolDefinition(ToolDefinitionCommon):
     """
-    Configuration for a graph-based memory bank.
+    Definition of the OpenAI GPT tool used by the agent.
 
     Attributes:
-        type (Literal[MemoryBankType.graph.value]): The type of memory bank (graph).
-        entities (List[str]): List of entities to focus on in the memory bank.
+        type (Literal[AgentTool.openai_gpt.value]): Type of tool (always openai_gpt).
+        api_key (str): The API key for OpenAI.
+        model (str): The model to use (default is "davinci").
+        remote_execution (Optional[RestAPIExecutionConfig]): Configuration for executing the tool remotely.
     """
-    # The type of memory bank, fixed to 'graph'
-    type: Literal[MemoryBankType.graph.value] = MemoryBankType.graph.value
-    # List of entities that the graph-based memory bank will focus on
-    entities: List[str]
+    # The type of tool, fixed to 'openai_gpt'
+    type: Literal[AgentTool.openai_gpt.value] = AgentTool.openai_gpt.value
+    # API key for OpenAI
+    api_key: str
+    # The model to use
+    model: str = "davinci"
+    # Optional configuration for executing the tool remotely
+    remote_execution: Optional[RestAPIExecutionConfig] = None
+
+@json_schema_type
+class LlamaToolDefinition(ToolDefinitionCommon):
+    """
+    Definition of the Llama tool used by the agent.
 
-# Unified MemoryBankConfig with support for multiple memory bank types
-MemoryBankConfig = Annotated[
+    Attributes:
+        type (Literal[AgentTool.llama.value]): Type of tool (always llama).
+        api_key (str): The API key for Llama.
+        model (str): The model to use (default is "llama-2").
+        remote_execution (Optional[RestAPIExecutionConfig]): Configuration for executing the tool remotely.
+    """
+    # The type of tool, fixed to 'llama'
+    type: Literal[AgentTool.llama.value] = AgentTool.llama.value
+    # API key for Llama
+    api_key: str
+    # The model to use
+    model: str = "llama-2"
+    # Optional configuration for executing the tool remotely
+    remote_execution: Optional[RestAPIExecutionConfig] = None
+
+# Union of all tool definitions for unified handling
+AgentToolDefinition = Annotated[
     Union[
-        AgentVectorMemoryBankConfig,          # Vector-based memory bank configuration
-        AgentKeyValueMemoryBankConfig,        # Key-value-based memory bank configuration
-        AgentKeywordMemoryBankConfig,         # Keyword-based memory bank configuration
-        AgentGraphMemoryBankConfig,           # Graph-based memory bank configuration
+        SearchToolDefinition,
+        WolframAlphaToolDefinition,
+        PhotogenToolDefinition,
+        CodeInterpreterToolDefinition,
+        FunctionCallToolDefinition,
+        OpenAIToolDefinition,
+        LlamaToolDefinition,
     ],
-    Field(discriminator="type"),  # Use the 'type' field to discriminate between different configurations
+    Field(discriminator="type"),  # Use the 'type' field to discriminate between different tool types
 ]
+
+# Validator for AgentToolDefinition, built once at import time so the discriminated
+# union is compiled a single time; use AGENT_TOOL_DEFINITION_ADAPTER.validate_python(data)
+AGENT_TOOL_DEFINITION_ADAPTER = TypeAdapter(AgentToolDefinition)
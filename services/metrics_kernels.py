@@ -0,0 +1,60 @@
+# services/metrics_kernels.py
+
+import numpy as np
+from numba import njit
+
+# Default weights for (cost, latency, quality, co2_impact), matching the ToolSelector
+# automated heuristic: cost + co2_impact - quality
+DEFAULT_WEIGHTS = np.array([1.0, 0.0, 1.0, 1.0])
+
+# fastmath is deliberately off: MetricsService reports inf for tools whose
+# metrics could not be fetched, latency is NaN when it was not measured, and
+# fastmath assumes values are finite.
+@njit(cache=True)
+def score(cost, latency, quality, co2_impact, weights):
+    """
+    Compute a score per tool from its metrics; lower is better.
+
+    Metrics with a zero weight are skipped, and an unmeasured (NaN) latency
+    contributes nothing, so such a tool is ranked on its other metrics rather
+    than below tools whose metrics could not be fetched (inf).
+
+    Args:
+        cost (np.ndarray): Cost per request in USD, one entry per tool.
+        latency (np.ndarray): Latency in seconds, one entry per tool.
+        quality (np.ndarray): Quality score, one entry per tool.
+        co2_impact (np.ndarray): CO2 impact in kg per request, one entry per tool.
+        weights (np.ndarray): Weights for cost, latency, quality, and CO2 impact.
+
+    Returns:
+        np.ndarray: The score of each tool.
+    """
+    n = cost.shape[0]
+    scores = np.zeros(n, dtype=np.float64)
+    for i in range(n):
+        if weights[0] != 0.0:
+            scores[i] += weights[0] * cost[i]
+        if weights[1] != 0.0 and not np.isnan(latency[i]):
+            scores[i] += weights[1] * latency[i]
+        if weights[2] != 0.0:
+            scores[i] -= weights[2] * quality[i]
+        if weights[3] != 0.0:
+            scores[i] += weights[3] * co2_impact[i]
+    return scores
+
+@njit(cache=True)
+def rank(cost, latency, quality, co2_impact, weights):
+    """
+    Order the tools from best to worst score.
+
+    Args:
+        cost (np.ndarray): Cost per request in USD, one entry per tool.
+        latency (np.ndarray): Latency in seconds, one entry per tool.
+        quality (np.ndarray): Quality score, one entry per tool.
+        co2_impact (np.ndarray): CO2 impact in kg per request, one entry per tool.
+        weights (np.ndarray): Weights for cost, latency, quality, and CO2 impact.
+
+    Returns:
+        np.ndarray: Tool indices sorted from best to worst; ties keep their input order.
+    """
+    return np.argsort(score(cost, latency, quality, co2_impact, weights), kind="mergesort")
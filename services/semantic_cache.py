@@ -0,0 +1,190 @@
+# services/semantic_cache.py
+
+import logging
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import faiss
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Default similarity threshold above which two prompts are treated as the same query
+DEFAULT_THRESHOLD = 0.87
+# Default sentence embedding model used to compare prompts
+DEFAULT_MODEL_NAME = "all-MiniLM-L6-v2"
+
+class SemanticCache:
+    """
+    Cache of tool responses keyed by the meaning of the prompt rather than its exact text.
+
+    Prompts are embedded with a sentence-transformers model and stored in a FAISS
+    inner-product index over L2-normalized vectors, so the index score is the cosine
+    similarity. Entries are grouped by namespace (typically the tool name) so that one
+    cache instance can be shared by several clients without mixing their responses;
+    each prompt is embedded once and the embedding is reused across namespaces.
+    The least recently used entry is evicted once max_entries is reached.
+    """
+    def __init__(
+        self,
+        threshold: float = DEFAULT_THRESHOLD,
+        max_entries: int = 1024,
+        model_name: str = DEFAULT_MODEL_NAME,
+        path: Optional[str] = None,
+        embedder: Optional[Callable[[str], np.ndarray]] = None,
+    ):
+        """
+        Initialize the SemanticCache.
+
+        Args:
+            threshold (float): Minimum cosine similarity for a cached response to be reused.
+            max_entries (int): Maximum number of cached responses across all namespaces.
+            model_name (str): The sentence-transformers model used to embed prompts.
+            path (Optional[str]): File used to persist the cache with pickle; loaded if it exists.
+            embedder (Optional[Callable[[str], np.ndarray]]): Function embedding one prompt;
+                defaults to the model_name model, which is loaded on the first embedding.
+        """
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.model_name = model_name
+        self.path = path
+        self._embedder = embedder
+        # Prompt -> embedding, so every namespace looking up the same prompt shares one embedding
+        self._embeddings: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._embed_lock = threading.Lock()
+        # One FAISS index per namespace, with entry ids mapped back to the cached data
+        self._indexes: Dict[str, faiss.IndexIDMap2] = {}
+        # Entry id -> (namespace, embedding, response), ordered from least to most recently used
+        self._entries: "OrderedDict[int, Tuple[str, np.ndarray, Any]]" = OrderedDict()
+        self._next_id = 0
+        # Clients may be executed from several worker threads at once
+        self._lock = threading.Lock()
+
+        if path and os.path.exists(path):
+            self.load(path)
+
+    def embed(self, prompt: str) -> np.ndarray:
+        """
+        Embed a prompt as an L2-normalized float32 row vector.
+
+        Embeddings are memoized per prompt, so looking the same prompt up in several
+        namespaces runs the model only once.
+
+        Args:
+            prompt (str): The prompt to embed.
+
+        Returns:
+            np.ndarray: An array of shape (1, dimension).
+        """
+        with self._embed_lock:
+            embedding = self._embeddings.get(prompt)
+            if embedding is not None:
+                self._embeddings.move_to_end(prompt)
+                return embedding
+            if self._embedder is None:
+                self._embedder = self._load_embedder()
+            embedding = np.ascontiguousarray(np.reshape(self._embedder(prompt), (1, -1)), dtype=np.float32)
+            faiss.normalize_L2(embedding)
+            self._embeddings[prompt] = embedding
+            if len(self._embeddings) > self.max_entries:
+                self._embeddings.popitem(last=False)
+            return embedding
+
+    def lookup(self, prompt: str, namespace: str = "default") -> Optional[Any]:
+        """
+        Return the cached response for the most similar prompt, if it is similar enough.
+
+        Args:
+            prompt (str): The prompt to look up.
+            namespace (str): The namespace to search.
+
+        Returns:
+            Optional[Any]: The cached response, or None on a cache miss.
+        """
+        embedding = self.embed(prompt)
+        with self._lock:
+            index = self._indexes.get(namespace)
+            if index is None or index.ntotal == 0:
+                return None
+            scores, ids = index.search(embedding, 1)
+            score, entry_id = float(scores[0][0]), int(ids[0][0])
+            if entry_id < 0 or score < self.threshold:
+                return None
+            # Mark the entry as most recently used
+            self._entries.move_to_end(entry_id)
+            return self._entries[entry_id][2]
+
+    def insert(self, prompt: str, response: Any, namespace: str = "default"):
+        """
+        Store the response to a prompt, evicting the least recently used entry if full.
+
+        Args:
+            prompt (str): The prompt that was answered.
+            response (Any): The response to cache.
+            namespace (str): The namespace to store the response under.
+        """
+        embedding = self.embed(prompt)
+        with self._lock:
+            while len(self._entries) >= self.max_entries:
+                self._evict_oldest()
+            entry_id = self._next_id
+            self._next_id += 1
+            self._index_for(namespace, embedding.shape[1]).add_with_ids(embedding, np.array([entry_id], dtype=np.int64))
+            self._entries[entry_id] = (namespace, embedding, response)
+
+    def save(self, path: Optional[str] = None):
+        """
+        Persist the cached entries to disk with pickle.
+
+        Args:
+            path (Optional[str]): Destination file; defaults to the path given at construction.
+        """
+        path = path or self.path
+        if not path:
+            raise ValueError("No path given to save the semantic cache to.")
+        with self._lock:
+            state = {"next_id": self._next_id, "entries": list(self._entries.items())}
+        with open(path, "wb") as f:
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def load(self, path: str):
+        """
+        Replace the cache contents with entries previously written by save().
+
+        Args:
+            path (str): The file to load.
+        """
+        with open(path, "rb") as f:
+            state = pickle.load(f)
+        with self._lock:
+            self._indexes.clear()
+            self._entries.clear()
+            self._next_id = state["next_id"]
+            for entry_id, (namespace, embedding, response) in state["entries"]:
+                self._index_for(namespace, embedding.shape[1]).add_with_ids(embedding, np.array([entry_id], dtype=np.int64))
+                self._entries[entry_id] = (namespace, embedding, response)
+        logger.info("Loaded %d semantic cache entries from %s", len(self._entries), path)
+
+    def _load_embedder(self) -> Callable[[str], np.ndarray]:
+        # Imported here so the model's dependencies are only loaded once a prompt is embedded
+        from sentence_transformers import SentenceTransformer
+
+        logger.info("Loading sentence embedding model %s", self.model_name)
+        model = SentenceTransformer(self.model_name)
+        return lambda prompt: model.encode([prompt], normalize_embeddings=True)
+
+    def _index_for(self, namespace: str, dimension: int) -> faiss.IndexIDMap2:
+        # Create the namespace's index on first use, sized to the embeddings it will hold
+        index = self._indexes.get(namespace)
+        if index is None:
+            index = faiss.IndexIDMap2(faiss.IndexFlatIP(dimension))
+            self._indexes[namespace] = index
+        return index
+
+    def _evict_oldest(self):
+        # Drop the least recently used entry from both the LRU order and its index
+        entry_id, (namespace, _, _) = self._entries.popitem(last=False)
+        self._indexes[namespace].remove_ids(np.array([entry_id], dtype=np.int64))
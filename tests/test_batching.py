@@ -0,0 +1,134 @@
+# tests/test_batching.py
+
+import asyncio
+import time
+
+import orjson
+from llama_models.llama3.api.datatypes import StopReason
+
+from plugins.openai_batch import parse_batch_output
+from utils.batching import batch_custom_id, execute_concurrently
+from utils.error_handling import is_transient_error
+
+class StatusError(Exception):
+    """Exception carrying an HTTP status code, like the SDK's APIStatusError."""
+    def __init__(self, status_code: int):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+class StubExecute:
+    """Execute callable that fails with the queued errors for a prompt before answering."""
+    def __init__(self, failures=None, delay: float = 0.0):
+        self.failures = {prompt: list(errors) for prompt, errors in (failures or {}).items()}
+        self.delay = delay
+        self.calls = []
+
+    def __call__(self, prompt: str) -> str:
+        self.calls.append(prompt)
+        errors = self.failures.get(prompt)
+        if errors:
+            raise errors.pop(0)
+        time.sleep(self.delay)
+        return prompt.upper()
+
+def run(execute, prompts, **kwargs):
+    return asyncio.run(execute_concurrently(execute, prompts, base_delay=0.0, **kwargs))
+
+def test_is_transient_error():
+    assert is_transient_error(TimeoutError())
+    assert is_transient_error(ConnectionError())
+    assert is_transient_error(StatusError(429))
+    assert is_transient_error(StatusError(503))
+    assert not is_transient_error(StatusError(401))
+    assert not is_transient_error(ValueError("bad prompt"))
+
+def test_transient_errors_are_retried():
+    execute = StubExecute(failures={"a": [TimeoutError(), StatusError(503)]})
+
+    results = run(execute, ["a"])
+
+    assert results.responses == {batch_custom_id(0): "A"}
+    assert execute.calls == ["a", "a", "a"]
+
+def test_permanent_errors_are_not_retried():
+    execute = StubExecute(failures={"b": [StatusError(401)]})
+
+    results = run(execute, ["a", "b"])
+
+    assert results.responses == {batch_custom_id(0): "A"}
+    assert execute.calls.count("b") == 1
+
+def test_gives_up_after_max_retries():
+    execute = StubExecute(failures={"a": [TimeoutError()] * 5})
+
+    results = run(execute, ["a"], max_retries=2)
+
+    assert results.responses == {}
+    assert execute.calls == ["a", "a", "a"]
+
+def test_latency_is_timed_per_successful_call():
+    execute = StubExecute(failures={"b": [StatusError(401)]}, delay=0.05)
+
+    results = run(execute, ["a", "b", "c", "d"], max_concurrency=4)
+
+    # Failed prompts have no latency, and concurrent calls are not divided by the prompt count
+    assert set(results.latencies) == {batch_custom_id(0), batch_custom_id(2), batch_custom_id(3)}
+    assert all(0.05 <= latency < 0.5 for latency in results.latencies.values())
+
+def test_latency_excludes_waiting_for_a_worker_thread():
+    execute = StubExecute(delay=0.1)
+
+    # More concurrent calls than the default executor has workers on small machines
+    results = run(execute, [f"prompt {index}" for index in range(20)])
+
+    assert len(results.latencies) == 20
+    assert all(0.1 <= latency < 0.2 for latency in results.latencies.values())
+
+class DictCache:
+    """Exact-match stand-in for SemanticCache."""
+    def __init__(self, entries=None):
+        self.entries = dict(entries or {})
+
+    def lookup(self, prompt, namespace="default"):
+        return self.entries.get((namespace, prompt))
+
+    def insert(self, prompt, response, namespace="default"):
+        self.entries[(namespace, prompt)] = response
+
+def test_cache_hits_skip_the_call_and_have_no_latency():
+    cache = DictCache({("llama", "a"): "cached"})
+    execute = StubExecute()
+
+    results = run(execute, ["a", "b"], cache=cache, namespace="llama")
+
+    assert results.responses == {batch_custom_id(0): "cached", batch_custom_id(1): "B"}
+    assert results.cached == {batch_custom_id(0)}
+    assert set(results.latencies) == {batch_custom_id(1)}
+    assert execute.calls == ["b"]
+    assert cache.entries[("llama", "b")] == "B"
+
+def test_parse_batch_output_skips_failed_requests():
+    records = [
+        {
+            "custom_id": batch_custom_id(0),
+            "response": {"status_code": 200, "body": {"choices": [{"message": {"content": " Paris \n"}, "finish_reason": "stop"}]}},
+            "error": None,
+        },
+        {
+            "custom_id": batch_custom_id(1),
+            "response": {"status_code": 500, "body": {}},
+            "error": None,
+        },
+        {
+            "custom_id": batch_custom_id(2),
+            "response": None,
+            "error": {"code": "invalid_request", "message": "bad"},
+        },
+    ]
+    output = b"\n".join(orjson.dumps(record) for record in records) + b"\n\n"
+
+    results = parse_batch_output(output)
+
+    assert list(results) == [batch_custom_id(0)]
+    assert results[batch_custom_id(0)].content == "Paris"
+    assert results[batch_custom_id(0)].stop_reason == StopReason.end_of_turn
@@ -0,0 +1,33 @@
+# tests/test_metrics_kernels.py
+
+import numpy as np
+
+from services.metrics_kernels import DEFAULT_WEIGHTS, rank, score
+
+ALL_WEIGHTS = np.array([1.0, 1.0, 1.0, 1.0])
+
+def test_score_combines_weighted_metrics():
+    scores = score(
+        np.array([2.0]), np.array([3.0]), np.array([5.0]), np.array([7.0]),
+        np.array([1.0, 2.0, 3.0, 4.0]),
+    )
+
+    assert scores[0] == 2.0 + 6.0 - 15.0 + 28.0
+
+def test_rank_orders_best_first_and_keeps_ties_in_input_order():
+    cost = np.array([1.0, 0.5, 0.5])
+    zeros = np.zeros(3)
+
+    assert list(rank(cost, zeros, zeros, zeros, DEFAULT_WEIGHTS)) == [1, 2, 0]
+
+def test_nan_latency_is_neutral_and_ranks_above_failed_metrics():
+    cost = np.array([0.1, np.inf, 0.2])
+    latency = np.array([np.nan, np.inf, 0.5])
+    quality = np.array([0.9, 0.0, 0.9])
+    co2_impact = np.array([0.0, np.inf, 0.0])
+
+    for weights in (DEFAULT_WEIGHTS, ALL_WEIGHTS):
+        scores = score(cost, latency, quality, co2_impact, weights)
+        assert not np.isnan(scores).any()
+        # Row 1 failed to fetch metrics (inf) and must rank last
+        assert list(rank(cost, latency, quality, co2_impact, weights)) == [0, 2, 1]
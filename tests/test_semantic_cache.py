@@ -0,0 +1,91 @@
+# tests/test_semantic_cache.py
+
+import numpy as np
+import pytest
+
+from services.semantic_cache import SemanticCache
+
+# Fixed unit vectors for the stub embedder; "capital of france" and "france capital"
+# are nearly identical, "weather today" is orthogonal to both
+VECTORS = {
+    "capital of france": np.array([1.0, 0.0, 0.0]),
+    "france capital": np.array([0.99, 0.1, 0.0]),
+    "weather today": np.array([0.0, 0.0, 1.0]),
+    "stock prices": np.array([0.0, 1.0, 0.0]),
+}
+
+class StubEmbedder:
+    """Embedder returning fixed vectors and counting how often it is called."""
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, prompt: str) -> np.ndarray:
+        self.calls.append(prompt)
+        return VECTORS[prompt]
+
+@pytest.fixture
+def embedder():
+    return StubEmbedder()
+
+def test_similar_prompt_hits_above_threshold(embedder):
+    cache = SemanticCache(threshold=0.9, embedder=embedder)
+    cache.insert("capital of france", "Paris", namespace="llama")
+
+    assert cache.lookup("france capital", namespace="llama") == "Paris"
+    assert cache.lookup("weather today", namespace="llama") is None
+
+def test_threshold_rejects_less_similar_prompt(embedder):
+    cache = SemanticCache(threshold=0.999, embedder=embedder)
+    cache.insert("capital of france", "Paris", namespace="llama")
+
+    assert cache.lookup("france capital", namespace="llama") is None
+    assert cache.lookup("capital of france", namespace="llama") == "Paris"
+
+def test_namespaces_do_not_share_responses(embedder):
+    cache = SemanticCache(embedder=embedder)
+    cache.insert("capital of france", "Paris", namespace="llama")
+
+    assert cache.lookup("capital of france", namespace="openai_gpt") is None
+
+def test_prompt_is_embedded_once_across_namespaces(embedder):
+    cache = SemanticCache(embedder=embedder)
+    cache.lookup("capital of france", namespace="openai_gpt")
+    cache.lookup("capital of france", namespace="llama")
+    cache.insert("capital of france", "Paris", namespace="llama")
+
+    assert embedder.calls == ["capital of france"]
+
+def test_lru_eviction_across_namespaces_removes_from_index(embedder):
+    cache = SemanticCache(max_entries=2, embedder=embedder)
+    cache.insert("capital of france", "Paris", namespace="openai_gpt")
+    cache.insert("weather today", "Sunny", namespace="llama")
+    # Touch the OpenAI entry so the Llama entry becomes the least recently used
+    assert cache.lookup("capital of france", namespace="openai_gpt") == "Paris"
+
+    cache.insert("stock prices", "Up", namespace="openai_gpt")
+
+    assert cache.lookup("weather today", namespace="llama") is None
+    assert cache._indexes["llama"].ntotal == 0
+    assert cache._indexes["openai_gpt"].ntotal == 2
+    assert cache.lookup("capital of france", namespace="openai_gpt") == "Paris"
+    assert cache.lookup("stock prices", namespace="openai_gpt") == "Up"
+
+def test_save_and_load_round_trip(embedder, tmp_path):
+    path = str(tmp_path / "cache.pkl")
+    cache = SemanticCache(path=path, embedder=embedder)
+    cache.insert("capital of france", "Paris", namespace="llama")
+    cache.insert("weather today", "Sunny", namespace="openai_gpt")
+    cache.save()
+
+    restored = SemanticCache(path=path, embedder=StubEmbedder())
+
+    assert restored.lookup("france capital", namespace="llama") == "Paris"
+    assert restored.lookup("weather today", namespace="openai_gpt") == "Sunny"
+    # New entries must not reuse the ids of loaded ones
+    restored.insert("stock prices", "Up", namespace="llama")
+    assert restored.lookup("capital of france", namespace="llama") == "Paris"
+    assert restored.lookup("stock prices", namespace="llama") == "Up"
+
+def test_save_without_path_raises(embedder):
+    with pytest.raises(ValueError):
+        SemanticCache(embedder=embedder).save()
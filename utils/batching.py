@@ -0,0 +1,119 @@
+# utils/batching.py
+
+import asyncio
+import functools
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from utils.error_handling import is_transient_error
+
+logger = logging.getLogger(__name__)
+
+def batch_custom_id(index: int) -> str:
+    """
+    Build the custom_id used to key the prompt at the given position in a batch.
+
+    Args:
+        index (int): Position of the prompt in the submitted list.
+
+    Returns:
+        str: The custom_id for that prompt.
+    """
+    return f"prompt-{index}"
+
+def _timed_call(execute: Callable, prompt: str) -> Tuple[Any, float]:
+    # Runs in the worker thread, so time spent queued for a thread is not counted
+    start_ns = time.perf_counter_ns()
+    response = execute(prompt=prompt)
+    return response, (time.perf_counter_ns() - start_ns) / 1e9
+
+@dataclass
+class BatchResults:
+    """
+    Outcome of running one tool over a list of prompts.
+
+    Attributes:
+        responses (Dict[str, Any]): Responses keyed by custom_id; failed prompts are left out.
+        latencies (Dict[str, float]): Seconds taken by each successful call, keyed by custom_id.
+        cached (Set[str]): custom_ids whose response came from the cache; they have no latency.
+    """
+    responses: Dict[str, Any] = field(default_factory=dict)
+    latencies: Dict[str, float] = field(default_factory=dict)
+    cached: Set[str] = field(default_factory=set)
+
+async def execute_concurrently(
+    execute: Callable,
+    prompts: List[str],
+    max_concurrency: int = 20,
+    max_retries: int = 3,
+    base_delay: float = 1.0,
+    cache: Optional[Any] = None,
+    namespace: str = "default",
+) -> BatchResults:
+    """
+    Run a blocking execute(prompt=...) callable over many prompts concurrently.
+
+    At most max_concurrency calls are in flight at once, each on a worker thread of a
+    pool owned by this call, so one tool's load never queues another tool's calls.
+    Calls failing with a transient error (see is_transient_error) are retried with
+    exponential backoff; any other error fails the prompt immediately. Latency is
+    measured inside the worker thread around the successful attempt only, so waiting
+    for the semaphore, a free thread, or a retry is not counted. When a cache is given (e.g. a SemanticCache), prompts it can
+    answer skip the call and are reported in BatchResults.cached instead of being timed.
+
+    Args:
+        execute (Callable): The tool's execute callable.
+        prompts (List[str]): The input prompts.
+        max_concurrency (int): Maximum number of calls running at the same time.
+        max_retries (int): Number of retries after the first failed attempt.
+        base_delay (float): Delay in seconds before the first retry; doubled on each retry.
+        cache (Optional[Any]): Cache with lookup(prompt, namespace) and insert(prompt, response, namespace).
+        namespace (str): The cache namespace of this tool's responses.
+
+    Returns:
+        BatchResults: Responses and per-call latencies keyed by custom_id.
+            Prompts that fail are logged and left out.
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(max_concurrency)
+    results = BatchResults()
+
+    async def _execute_with_retry(executor: ThreadPoolExecutor, custom_id: str, prompt: str):
+        async with semaphore:
+            if cache is not None:
+                cached = await loop.run_in_executor(executor, cache.lookup, prompt, namespace)
+                if cached is not None:
+                    results.responses[custom_id] = cached
+                    results.cached.add(custom_id)
+                    return
+            for attempt in range(max_retries + 1):
+                try:
+                    response, latency = await loop.run_in_executor(
+                        executor, functools.partial(_timed_call, execute, prompt),
+                    )
+                except Exception as e:
+                    if attempt == max_retries or not is_transient_error(e):
+                        raise
+                    delay = base_delay * 2 ** attempt
+                    logger.warning("Attempt %d failed (%s); retrying in %.1fs", attempt + 1, e, delay)
+                    await asyncio.sleep(delay)
+                    continue
+                results.latencies[custom_id] = latency
+                results.responses[custom_id] = response
+                if cache is not None:
+                    await loop.run_in_executor(executor, cache.insert, prompt, response, namespace)
+                return
+
+    custom_ids = [batch_custom_id(index) for index in range(len(prompts))]
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        outcomes = await asyncio.gather(
+            *[_execute_with_retry(executor, custom_id, prompt) for custom_id, prompt in zip(custom_ids, prompts)],
+            return_exceptions=True,
+        )
+    for custom_id, outcome in zip(custom_ids, outcomes):
+        if isinstance(outcome, Exception):
+            logger.error("Prompt %s failed: %s", custom_id, outcome)
+    return results
@@ -0,0 +1,38 @@
+# utils/error_handling.py
+
+import openai
+import requests
+
+# HTTP status codes worth retrying besides 5xx: request timeout and rate limiting
+_TRANSIENT_STATUS_CODES = {408, 429}
+
+def is_transient_error(error: BaseException) -> bool:
+    """
+    Decide whether a failed tool call may succeed if it is retried.
+
+    Timeouts, connection errors, rate limiting (429), and server errors (5xx) are
+    transient. Everything else, such as an invalid API key (401) or a malformed
+    request (400), fails the same way on every attempt.
+
+    Args:
+        error (BaseException): The exception raised by the tool call.
+
+    Returns:
+        bool: True if the call should be retried.
+    """
+    if isinstance(error, (
+        TimeoutError,
+        ConnectionError,
+        requests.Timeout,
+        requests.ConnectionError,
+        openai.APIConnectionError,  # Also covers openai.APITimeoutError
+    )):
+        return True
+
+    # HTTP errors carry their status code on the exception or on its response
+    status_code = getattr(error, "status_code", None)
+    if status_code is None:
+        status_code = getattr(getattr(error, "response", None), "status_code", None)
+    if not isinstance(status_code, int):
+        return False
+    return status_code in _TRANSIENT_STATUS_CODES or status_code >= 500